@@ -7,7 +7,7 @@ This allows for single device commands and loop calls of methods
 @note:
 """
 from typing import List, Tuple
-from PySide6.QtCore import QTimer, QThread, QObject, Signal, Slot
+from PySide6.QtCore import QTimer, QThread, QObject, Signal, Slot, Qt
 from src.core.context import DeviceConnectionError, ErrorType
 from src.core.context import DeviceRequest, RequestResult, RequestType, DeviceProfile
 from src.backend.connection_status import ConnectionStatus
@@ -261,8 +261,10 @@ class WorkerHandler(QObject):
 		self._worker.moveToThread(self._thread)
 
 		# connect Signals for results and requests
-		self._worker.resultReady.connect(self.handle_result)
-		self.requestWorker.connect(self._worker.execute_request)
+		# Requests are always queued, so the blocking device call never runs on the GUI thread
+		# and the UI handlers (_start, _apply, ...) return to the event loop immediately.
+		self._worker.resultReady.connect(self.handle_result, Qt.QueuedConnection)
+		self.requestWorker.connect(self._worker.execute_request, Qt.QueuedConnection)
 		self._thread.finished.connect(self._on_thread_finished)
 
 		# start thread
@@ -2,7 +2,7 @@
 Module for proving general utility classes.
 @autor: Merlin Schmidt
 @date: 2025-15-10
-@file: scr/core/utils.py
+@file: src/core/utilities.py
 """
 import os, json, tempfile
 from typing import Any
@@ -46,6 +46,12 @@ class FilesUtils:
 		self.folder = os.path.join(file_path, "settings")
 		self.settings_path = os.path.join(file_path, "settings", self.filename)
 		os.makedirs(self.folder, exist_ok=True)
+		# Cached settings and the modification time of the settings file they were read from
+		self._settings_cache = None
+		self._settings_mtime = -1
+		# Cached ports and the modification time of the port file they were read from
+		self._ports_cache = None
+		self._ports_mtime = -1
 
 		# Read Settings but discard result
 		# this ensures that the settings file is created if it does not exist
@@ -55,20 +61,31 @@ class FilesUtils:
 	def read_settings(self) -> dict | None:
 		"""
 		Read the settings file and return a specific settin.
+		The file is only parsed again if it was modified since the last read.
+		The returned dictionary is cached and must not be modified.
 		:return: The settings dictionary, Returns the default on reading error and None otherwise
 		:rtype: dict | None
 		"""
 		# Create settings file if it does not exist
-		if not os.path.exists(self.settings_path):
-			with open(self.settings_path, "w", encoding="utf-8") as f:
+		# Exclusive creation fails if the file exists, so no separate existence check is needed
+		try:
+			with open(self.settings_path, "x", encoding="utf-8") as f:
 				# dump default settings
 				json.dump(self.default_settings, f, indent=4)
+		except FileExistsError:
+			pass
 
 		try:
+			# Return the cached settings if the file did not change
+			mtime = os.stat(self.settings_path).st_mtime_ns
+			if mtime == self._settings_mtime:
+				return self._settings_cache
 			# Try to read settings file
 			with open(self.settings_path, "r", encoding="utf-8") as f:
 				data = json.load(f)
-			# Return the data
+			# Cache and return the data
+			self._settings_cache = data
+			self._settings_mtime = mtime
 			return data
 		except (json.decoder.JSONDecodeError, OSError):
 			# On Error return default settings
@@ -89,8 +106,12 @@ class FilesUtils:
 		:return: None
 		:rtype: None
 		"""
-		# Read the current settigns
-		data = self.read_settings()
+		# Read the current settigns, the cached settings are used without reading the file again
+		# A copy is edited, so the cache stays valid if writing fails
+		if self._settings_cache is not None:
+			data = dict(self._settings_cache)
+		else:
+			data = dict(self.read_settings())
 		# Edit the specific setting
 		data[setting] = value
 
@@ -98,27 +119,46 @@ class FilesUtils:
 		fd, tmp_path = tempfile.mkstemp(dir=self.folder, prefix="settings_", text=True)
 		try:
 			with os.fdopen(fd, "w", encoding="utf-8") as f:
-				# Create temp file and write data
-				json.dump(data, f, indent=2)
+				# Create temp file and write the serialized data at once
+				f.write(json.dumps(data, indent=2))
 				f.flush()
 				os.fsync(f.fileno())
 			# Replace original file with temp file
 			os.replace(tmp_path, self.settings_path)
+			# Update the cache with the written settings
+			self._settings_cache = data
+			self._settings_mtime = os.stat(self.settings_path).st_mtime_ns
 		except (json.decoder.JSONDecodeError, OSError):
+			# Remove temp file, it only still exists if writing failed
+			self._remove_temp_file(tmp_path)
 			# TODO: PortSetError?
 			raise PortSetError
-		finally:
-			# Remove temp file if it still exists
-			if os.path.exists(tmp_path):
-				try:
-					os.remove(tmp_path)
-				except OSError:
-					pass
+		except Exception:
+			self._remove_temp_file(tmp_path)
+			raise
+		return
+
+	@staticmethod
+	def _remove_temp_file(tmp_path: str) -> None:
+		"""
+		Remove a temp file after a failed atomic write.
+
+		:param tmp_path: Path of the temp file
+		:type tmp_path: str
+		:return: None
+		:rtype: None
+		"""
+		try:
+			os.remove(tmp_path)
+		except OSError:
+			pass
 		return
 
 	def read_port_file(self) -> dict:
 		"""
 		Read the default port file.
+		The file is only parsed again if it was modified since the last read.
+		The returned dictionary is cached and must not be modified.
 
 		:return: The contents of the port file
 		:rtype: dict
@@ -126,9 +166,16 @@ class FilesUtils:
 		# read port file and return contents
 
 		try:
-			# Try to read ports file
-			with open(self.ports_path, "r", encoding="utf-8") as f:
-				ports = json.load(f)
+			# Return the cached ports if the file did not change
+			mtime = os.stat(self.ports_path).st_mtime_ns
+			if mtime == self._ports_mtime:
+				return self._ports_cache
+			# Try to read ports file, the whole file is read at once and parsed from bytes
+			with open(self.ports_path, "rb") as f:
+				ports = json.loads(f.read())
+			# Cache and return the ports
+			self._ports_cache = ports
+			self._ports_mtime = mtime
 			return ports
 		except (json.decoder.JSONDecodeError, OSError):
 			# On error recreate default ports file and return default ports
@@ -160,73 +207,53 @@ class FilesUtils:
 		fd, tmp_path = tempfile.mkstemp(dir=self.ports_folder, prefix="ports_", text=True)
 		try:
 			with os.fdopen(fd, "w", encoding="utf-8") as f:
-				json.dump(ports, f, indent=2)
+				f.write(json.dumps(ports, indent=2))
 				f.flush()
 				os.fsync(f.fileno())
 			os.replace(tmp_path, self.ports_path)
 		except (json.decoder.JSONDecodeError, OSError):
+			self._remove_temp_file(tmp_path)
 			raise PortSetError
-		finally:
-			if os.path.exists(tmp_path):
-				try:
-					os.remove(tmp_path)
-				except OSError:
-					pass
+		except Exception:
+			self._remove_temp_file(tmp_path)
+			raise
 		return
 
 # Exception classes #
-class ParameterNotSetError(Exception):
-	def __init__(self, message) -> None:
-		self.message = message
-		super().__init__(self.message)
-	def __str__(self) -> str:
-		return self.message
+class LabSyncError(Exception):
+	"""
+	Base class for the LabSync exceptions, the message is also the string representation.
 
-class DeviceParameterError(Exception):
-	def __init__(self, message) -> None:
+	:param message: Message of the exception
+	:type message: str
+	"""
+	def __init__(self, message: str = "") -> None:
 		self.message = message
 		super().__init__(self.message)
-	def __str__(self) -> str:
-		return self.message
 
-class ParameterOutOfRangeError(Exception):
-	def __init__(self, message) -> None:
-		self.message = message
-		super().__init__(self.message)
 	def __str__(self) -> str:
 		return self.message
 
-class UIParameterError(Exception):
-	def __init__(self, message) -> None:
-		self.message = message
-		super().__init__(self.message)
+class ParameterNotSetError(LabSyncError):
+	"""Raised when a device parameter could not be set"""
 
-	def __str__(self) -> str:
-		return self.message
+class DeviceParameterError(LabSyncError):
+	"""Raised when a device parameter is not supported"""
 
-class PortSetError(Exception):
-	def __init__(self, message) -> None:
-		self.message = message
-		super().__init__(self.message)
-
-	def __str__(self) -> str:
-		return self.message
+class ParameterOutOfRangeError(LabSyncError):
+	"""Raised when a device parameter is out of range"""
 
-class DeviceConnectionError(Exception):
-	def __init__(self, message) -> None:
-		self.message = message
-		super().__init__(self.message)
+class UIParameterError(LabSyncError):
+	"""Raised when a parameter from the UI is invalid"""
 
-	def __str__(self) -> str:
-		return self.message
+class PortSetError(LabSyncError):
+	"""Raised when the settings or port file could not be written"""
 
-class DeviceTaskError(Exception):
-	def __init__(self, message) -> None:
-		self.message = message
-		super().__init__(self.message)
+class DeviceConnectionError(LabSyncError):
+	"""Raised when a device connection fails"""
 
-	def __str__(self) -> str:
-		return self.message
+class DeviceTaskError(LabSyncError):
+	"""Raised when a device task fails"""
 
 class ValueHandler:
 	"""
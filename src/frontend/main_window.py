@@ -24,8 +24,6 @@ from src.frontend.widgets.devices.luxx_expert import LaserWidgetExpert
 from src.frontend.widgets.devices.luxx_normal import LaserWidgetNormal
 from src.frontend.widgets.devices.fsv_normal import FsvNormalWidget
 
-from src.frontend.widgets.dialogs import LaserInfoDialog, PortSelectionDialog, SettingsDialog
-
 class MainWindow(QMainWindow):
 	"""
 	Main window class for the PySide6 LabSync application.
@@ -348,28 +346,33 @@ class MainWindow(QMainWindow):
 		self.info_panel.update_indicator(device_id, status)
 		return
 
-	@Slot(dict)
+	@Slot(object)
 	def handle_ui_request(self, request: Dict[tuple, Any]) -> None:
 		"""
 		Handles the request from a widget and formats it as a UIRequest object.
 		This will then be sent to LabSync to finally send to device.
+		Widgets may also send a tuple of request dicts to batch several requests in one emission.
+		The request is passed by reference and must not be mutated.
 		:param request: Request object.
-		:type request: Dict[str, str, Any]
+		:type request: Dict[str, str, Any] | tuple
 		:return: None
 		"""
-		# iterate over request dict and create UIRequest objects
-		for keys, value in request.items():
-			device_id = keys[0]
-			parameter = keys[1]
-			# create UIRequest object
-			cmd = UIRequest(
-				device_id=device_id,
-				cmd_type=RequestType.SET,
-				parameter=parameter,
-				value=value
-			)
-			# send update request to device / worker through AppController
-			self.deviceRequest.emit(cmd)
+		# batched requests are a tuple of request dicts
+		requests = request if isinstance(request, tuple) else (request,)
+		for single_request in requests:
+			# iterate over request dict and create UIRequest objects
+			for keys, value in single_request.items():
+				device_id = keys[0]
+				parameter = keys[1]
+				# create UIRequest object
+				cmd = UIRequest(
+					device_id=device_id,
+					cmd_type=RequestType.SET,
+					parameter=parameter,
+					value=value
+				)
+				# send update request to device / worker through AppController
+				self.deviceRequest.emit(cmd)
 		return
 
 	@Slot(str, bool)
@@ -390,7 +393,7 @@ class MainWindow(QMainWindow):
 		self.deviceRequest.emit(cmd)
 		return
 
-	@Slot(dict)
+	@Slot(object, str)
 	def update_ui_request(self, request: Dict[tuple, Any], sender: str) -> None:
 		"""
 		Gets an update from the widget and passes it to another.
@@ -452,7 +455,8 @@ class MainWindow(QMainWindow):
 
 		if request_type == "POLL" and parameter == "INFO":
 			# update laser info dialog if open
-			if self.laser_dialog is not None:
+			# The dialog is kept after closing, so it is only updated while visible
+			if self.laser_dialog is not None and self.laser_dialog.isVisible():
 				# TODO this works - is there a better way?
 				if result.value is None:
 					return
@@ -477,18 +481,17 @@ class MainWindow(QMainWindow):
 		:return: None
 		"""
 		if self.laser_dialog is None:
-			# Create new dialog if not open
+			# Create the dialog once, it is kept and reused after closing
+			# The dialogs module is only imported once a dialog is first opened
+			from src.frontend.widgets.dialogs import LaserInfoDialog
 			self.laser_dialog = LaserInfoDialog(self)
 
-			# connect the finished signal to the close handler
-			self.laser_dialog.finished.connect(self._on_laser_dialog_closed)
+		if not self.laser_dialog.isVisible():
+			# Show dialog if not visible
 			self.laser_dialog.show()
-		else:
-			if not self.laser_dialog.isVisible():
-				# Show dialog if not visible
-				self.laser_dialog.show()
-			# Raise dialog to front
-			self.laser_dialog.raise_()
+		# Raise dialog to front
+		self.laser_dialog.raise_()
+		self.laser_dialog.activateWindow()
 
 		# Request laser info from both lasers
 		# This asynchronously updates the dialog when results arrive, fields will be initialized differently and updated.
@@ -502,18 +505,6 @@ class MainWindow(QMainWindow):
 			self.deviceRequest.emit(info_request)
 		return
 
-	@Slot()
-	def _on_laser_dialog_closed(self) -> None:
-		"""
-		Handler for laser info dialog closed event.
-		:return: None
-		"""
-		# disconnect the finished signal
-		self.laser_dialog.finished.disconnect(self._on_laser_dialog_closed)
-		# set dialog object to None
-		self.laser_dialog = None
-		return
-
 	@Slot()
 	def _show_port_dialog(self) -> None:
 		"""
@@ -522,6 +513,8 @@ class MainWindow(QMainWindow):
 		"""
 		if self.port_dialog is None:
 			# Create new dialog if not open
+			# The dialogs module is only imported once a dialog is first opened
+			from src.frontend.widgets.dialogs import PortSelectionDialog
 			self.port_dialog = PortSelectionDialog(self)
 			# connect the finished signal to the close handler
 			self.port_dialog.finished.connect(self._on_port_dialog_closed)
@@ -563,6 +556,8 @@ class MainWindow(QMainWindow):
 		"""
 		if self.settings_dialog is None:
 			# Create new dialog if not open
+			# The dialogs module is only imported once a dialog is first opened
+			from src.frontend.widgets.dialogs import SettingsDialog
 			self.settings_dialog = SettingsDialog(self)
 			# connect the finished signal to the close handler
 			self.settings_dialog.finished.connect(self._on_settings_dialog_closed)
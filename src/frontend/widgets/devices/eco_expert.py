@@ -6,10 +6,11 @@ Module for creating and operating the PySide6 EcoVario expert mode widgets.
 @note:
 """
 from PySide6.QtCore import Signal, Slot
-from PySide6.QtGui import QDoubleValidator, Qt
+from PySide6.QtGui import Qt
 from PySide6.QtWidgets import QWidget, QGridLayout, QPushButton, QCheckBox, QSpacerItem, QLabel, QMessageBox
 
-from src.frontend.widgets.utilities import create_input_field, create_output_field
+from src.frontend.widgets.utilities import (create_input_field, create_output_field, set_text_if_changed,
+										   to_float, get_double_validator)
 from typing import Dict, Any
 
 class StageWidgetExpert(QWidget):
@@ -25,11 +26,14 @@ class StageWidgetExpert(QWidget):
 		"""Constructor method
 		"""
 		super().__init__()
+		# disable updates while the widgets are created to avoid repeated layout passes
+		self.setUpdatesEnabled(False)
 		# Store the device ID
 		self.device_id = device_id
 
 		# creating layout
 		layout = QGridLayout()
+		layout.setEnabled(False)
 		layout.setVerticalSpacing(10)
 
 		# creating and adding widgets to layout
@@ -45,9 +49,9 @@ class StageWidgetExpert(QWidget):
 		self.out_current_position = create_output_field(layout, "Current position", "0.0", "mm", 1, 0)
 		self.out_target_position = create_output_field(layout, "Target position", "0.0", "mm", 3, 0)
 		self.in_new_position = create_input_field(layout, "New position", "0.0", "mm", 5, 0)
-		self.in_new_position.setValidator(QDoubleValidator())
+		self.in_new_position.setValidator(get_double_validator())
 		self.in_speed = create_input_field(layout, "Speed", "25.0", "mm/s", 7, 0)
-		self.in_speed.setValidator(QDoubleValidator())
+		self.in_speed.setValidator(get_double_validator())
 		layout.addItem(QSpacerItem(10, 100), 9, 0)
 		layout.addWidget(start_button, 10, 0)
 		layout.addWidget(stop_button, 11, 0)
@@ -55,9 +59,9 @@ class StageWidgetExpert(QWidget):
 		layout.addItem(QSpacerItem(200, 10), 0, 1)
 
 		self.in_accell = create_input_field(layout, "Acceleration", "501.30", "mm/s^2", 1, 2)
-		self.in_accell.setValidator(QDoubleValidator())
+		self.in_accell.setValidator(get_double_validator())
 		self.in_deaccell = create_input_field(layout, "Deacceleration", "501.30", "mm/s^2", 3, 2)
-		self.in_deaccell.setValidator(QDoubleValidator())
+		self.in_deaccell.setValidator(get_double_validator())
 		self.out_error_code = create_output_field(layout, "Error code", "", "", 10, 2)
 		self.out_error_code.setAlignment(Qt.AlignLeft)
 
@@ -66,14 +70,17 @@ class StageWidgetExpert(QWidget):
 		layout.addWidget(self.sync, 5, 2)
 		layout.addWidget(reset_error_button, 10, 2)
 		self.setLayout(layout)
+		# re-enable layout and updates once all widgets are added
+		layout.setEnabled(True)
+		self.setUpdatesEnabled(True)
 
 		# signal routing #
 		stop_button.clicked.connect(self._stop)
 		start_button.clicked.connect(self._start)
 		reset_error_button.clicked.connect(self._reset_error)
 
-		auto_home_button.clicked.connect(lambda: self._home_stage(True))
-		manual_home_button.clicked.connect(lambda: self._home_stage(False))
+		auto_home_button.clicked.connect(self._auto_home)
+		manual_home_button.clicked.connect(self._manual_home)
 
 		self.in_new_position.returnPressed.connect(self._send_update)
 		self.in_speed.editingFinished.connect(self._send_update)
@@ -87,10 +94,10 @@ class StageWidgetExpert(QWidget):
 		"""
 		try:
 			# Read and convert input values
-			pos = float(self.out_target_position.text().replace(",", "."))
-			vel = float(self.in_speed.text().replace(",", "."))
-			accell = float(self.in_accell.text().replace(",", "."))
-			deaccell = float(self.in_deaccell.text().replace(",", "."))
+			pos = to_float(self.out_target_position.text())
+			vel = to_float(self.in_speed.text())
+			accell = to_float(self.in_accell.text())
+			deaccell = to_float(self.in_deaccell.text())
 
 			# TODO: Does the sync checkbox have any effect in expert mode?
 			# Store parameters in a dictionary
@@ -149,7 +156,7 @@ class StageWidgetExpert(QWidget):
 				# get the corresponding widget
 				widget = getattr(self, supproted_parameters[key[1]])
 				# update the widget with the new parameter value
-				widget.setText(str(parameter))
+				set_text_if_changed(widget, str(parameter))
 		return
 
 	@Slot()
@@ -175,6 +182,23 @@ class StageWidgetExpert(QWidget):
 		return
 
 	@Slot()
+	def _auto_home(self) -> None:
+		"""
+		Sends auto home request to the controller
+		:return: None
+		"""
+		self._home_stage(True)
+		return
+
+	@Slot()
+	def _manual_home(self) -> None:
+		"""
+		Sends manual home request to the controller
+		:return: None
+		"""
+		self._home_stage(False)
+		return
+
 	def _home_stage(self, auto: bool) -> None:
 		if auto:
 			self.sendRequest.emit({
@@ -6,10 +6,11 @@ Module for creating and operating the PySide6 EcoVario normal mode widgets.
 @note:
 """
 from PySide6.QtCore import Signal, Slot
-from PySide6.QtGui import QDoubleValidator, Qt
+from PySide6.QtGui import Qt
 from PySide6.QtWidgets import QWidget, QGridLayout, QPushButton, QSpacerItem, QLabel, QMessageBox
 
-from src.frontend.widgets.utilities import create_input_field, create_output_field
+from src.frontend.widgets.utilities import (create_input_field, create_output_field, get_double_validator,
+										   set_text_if_changed, to_float)
 from typing import Dict, Any
 
 class StageWidgetNormal(QWidget):
@@ -25,6 +26,8 @@ class StageWidgetNormal(QWidget):
 		"""Constructor method
 		"""
 		super().__init__()
+		# disable updates while the widgets are created to avoid repeated layout passes
+		self.setUpdatesEnabled(False)
 		# Store the device ID
 		self.device_id = device_id
 
@@ -34,6 +37,7 @@ class StageWidgetNormal(QWidget):
 
 		# creating layout
 		layout = QGridLayout()
+		layout.setEnabled(False)
 		layout.setVerticalSpacing(10)
 
 		# creating and adding widgets to layout
@@ -41,17 +45,20 @@ class StageWidgetNormal(QWidget):
 		self.out_current_position = create_output_field(layout, "Current position", "0.0", "mm", 1, 0)
 		self.out_target_position = create_output_field(layout, "Target position", "0.0", "mm", 3, 0)
 		self.in_new_position = create_input_field(layout, "New position", "0.0", "mm", 5, 0)
-		self.in_new_position.setValidator(QDoubleValidator())
+		self.in_new_position.setValidator(get_double_validator())
 		self.in_speed = create_input_field(layout, "Speed", "25.0", "mm/s", 7, 0)
-		self.in_speed.setValidator(QDoubleValidator())
+		self.in_speed.setValidator(get_double_validator())
 		layout.addItem(QSpacerItem(10, 100), 9, 0)
 		layout.addWidget(start_button, 10, 0)
 		layout.addWidget(stop_button, 11, 0)
 		layout.addItem(QSpacerItem(10, 40), 12, 0)
-		self.out_error_code = create_output_field(layout, "Error code", "", "", 13, 0)
-		self.out_error_code.setAlignment(Qt.AlignLeft)
+		# The error code field is only created once an error is received
+		self.out_error_code = None
 
 		self.setLayout(layout)
+		# re-enable layout and updates once all widgets are added
+		layout.setEnabled(True)
+		self.setUpdatesEnabled(True)
 		start_button.clicked.connect(self._start)
 		stop_button.clicked.connect(self._stop)
 		self.in_new_position.returnPressed.connect(self._send_update)
@@ -66,8 +73,8 @@ class StageWidgetNormal(QWidget):
 		"""
 		try:
 			# Read and convert input values
-			pos = float(self.out_target_position.text().replace(",", "."))
-			vel = float(self.in_speed.text().replace(",", "."))
+			pos = to_float(self.out_target_position.text())
+			vel = to_float(self.in_speed.text())
 			# For the normal mode, we use fixed acceleration and deacceleration values
 			# These
 			accell = 501.30
@@ -124,11 +131,25 @@ class StageWidgetNormal(QWidget):
 		for key, parameter in parameters.items():
 			if not key[1] in supproted_parameters:
 				pass
+			elif key[1] == "error_code" and self.out_error_code is None:
+				# Only create the error code field on the first actual error
+				if parameter:
+					self._create_error_code_field()
+					self.out_error_code.setText(str(parameter))
 			else:
 				# get the corresponding widget
 				widget = getattr(self, supproted_parameters[key[1]])
 				# update the widget with the new parameter value
-				widget.setText(str(parameter))
+				set_text_if_changed(widget, str(parameter))
+		return
+
+	def _create_error_code_field(self) -> None:
+		"""
+		Helper method to create the error code output field.
+		:return: None
+		"""
+		self.out_error_code = create_output_field(self.layout(), "Error code", "", "", 13, 0)
+		self.out_error_code.setAlignment(Qt.AlignLeft)
 		return
 
 	@Slot()
@@ -6,12 +6,12 @@ Module for creating and operating the PySide6 FSV3000 normal mode widgets.
 @note:
 """
 from PySide6.QtCore import Signal, Slot
-from PySide6.QtGui import QDoubleValidator
 from PySide6.QtWidgets import (QWidget, QGridLayout,
 							   QPushButton, QSpacerItem,
 							   QLabel, QFileDialog, QMessageBox)
 
-from src.frontend.widgets.utilities import create_input_field, create_combo_box
+from src.frontend.widgets.utilities import (create_input_field, create_combo_box, get_double_validator,
+										   set_text_if_changed, set_index_if_changed, to_float)
 from typing import Dict, Any
 
 class FsvNormalWidget(QWidget):
@@ -24,44 +24,59 @@ class FsvNormalWidget(QWidget):
 	saveDataRequest = Signal(object)
 
 	# Define possible device parameter options for combo boxes
-	sweep_types = ["Sweep", "FFT"]
-	meas_types = ["Single", "Average"]
-	units = ["dBm", "dBmV"]
+	sweep_types = ("Sweep", "FFT")
+	meas_types = ("Single", "Average")
+	units = ("dBm", "dBmV")
+	# Initial value of the average count field
+	default_avg_count = "64"
 
 	def __init__(self, device_id: str) -> None:
 		"""Constructor method
 		"""
 		super().__init__()
+		# disable updates while the widgets are created to avoid repeated layout passes
+		self.setUpdatesEnabled(False)
 		# Store device ID
 		self.device_id = device_id
 
 		# creating and adding widgets to layout
 		start_button = QPushButton("Start")
 		layout = QGridLayout()
+		layout.setEnabled(False)
 		layout.setVerticalSpacing(10)
 
 		layout.addWidget(QLabel("FSV Controls"), 0, 0)
 		self.center_frequency = create_input_field(layout, "Center Frequency", "1000.0", "Hz", 1, 0)
-		self.center_frequency.setValidator(QDoubleValidator())
+		self.center_frequency.setValidator(get_double_validator())
 		self.span = create_input_field(layout, "Span", "1000.0", "Hz", 3, 0)
-		self.span.setValidator(QDoubleValidator())
+		self.span.setValidator(get_double_validator())
 		self.bandwidth = create_input_field(layout, "Bandwidth", "100.0", "Hz", 5, 0)
-		self.bandwidth.setValidator(QDoubleValidator())
+		self.bandwidth.setValidator(get_double_validator())
 		self.sweep_points = create_input_field(layout, "Sweep points", "2001", "", 3, 2)
-		self.sweep_points.setValidator(QDoubleValidator())
+		self.sweep_points.setValidator(get_double_validator())
 		self.sweep_type = create_combo_box(layout, self.sweep_types, "Sweep type", 1, 2)
 		self.meas_type = create_combo_box(layout, self.meas_types, "Measurement type", 8, 2)
-		self.avg_count = create_input_field(layout, "Average count", "64", "", 10, 2)
+		# The average count field is only created once the "Average" measurement type is selected
+		self.avg_count = None
 		self.unit = create_combo_box(layout, self.units, "Unit", 5, 2)
+		# Cache the selected combo box values, these are updated on index change
+		self._sweep_type_val = self.sweep_types[self.sweep_type.currentIndex()]
+		self._meas_type_val = self.meas_types[self.meas_type.currentIndex()]
+		self._unit_val = self.units[self.unit.currentIndex()]
 
 		layout.addItem(QSpacerItem(200, 10), 0, 1)
 		layout.addItem(QSpacerItem(10, 70), 7, 0)
 		layout.addWidget(start_button, 8, 0)
 
 		self.setLayout(layout)
+		# re-enable layout and updates once all widgets are added
+		layout.setEnabled(True)
+		self.setUpdatesEnabled(True)
 		# Connect button and combo box signals to their respective slots
 		start_button.clicked.connect(self._start_measurement)
 		self.meas_type.currentIndexChanged.connect(self._toggle_avg_count)
+		self.sweep_type.currentIndexChanged.connect(self._set_sweep_type)
+		self.unit.currentIndexChanged.connect(self._set_unit)
 		self._toggle_avg_count(self.meas_type.currentIndex())
 		return
 
@@ -72,14 +87,14 @@ class FsvNormalWidget(QWidget):
 		:return: None
 		"""
 		# Retrieve and process input values, converting as necessary
-		center_frequency = float(self.center_frequency.text().replace(",", "."))
-		span = float(self.span.text().replace(",", "."))
-		bandwidth = float(self.bandwidth.text().replace(",", "."))
+		center_frequency = to_float(self.center_frequency.text())
+		span = to_float(self.span.text())
+		bandwidth = to_float(self.bandwidth.text())
 		sweep_points = int(self.sweep_points.text())
-		avg_count = int(self.avg_count.text())
-		sweep_type = self.sweep_types[self.sweep_type.currentIndex()]
-		meas_type = self.meas_types[self.meas_type.currentIndex()]
-		unit = self.units[self.unit.currentIndex()]
+		avg_count = int(self.avg_count.text()) if self.avg_count is not None else int(self.default_avg_count)
+		sweep_type = self._sweep_type_val
+		meas_type = self._meas_type_val
+		unit = self._unit_val
 
 		# Create parameter dictionary to send as request
 		parameters = {
@@ -102,14 +117,41 @@ class FsvNormalWidget(QWidget):
 		:param index:
 		:return:
 		"""
-		if self.meas_types[index] == "Average":
+		self._meas_type_val = self.meas_types[index]
+		if self._meas_type_val == "Average":
+			if self.avg_count is None:
+				# Create the average count input on first use
+				self.avg_count = create_input_field(self.layout(), "Average count",
+													self.default_avg_count, "", 10, 2)
 			# For average measurement, show average count input
 			self.avg_count.show()
-		else:
+		elif self.avg_count is not None:
 			# For single measurement, hide average count input
 			self.avg_count.hide()
 		return
 
+	@Slot(int)
+	def _set_sweep_type(self, index: int) -> None:
+		"""
+		Helper method to cache the selected sweep type.
+		:param index: Index of the selected sweep type
+		:type index: int
+		:return: None
+		"""
+		self._sweep_type_val = self.sweep_types[index]
+		return
+
+	@Slot(int)
+	def _set_unit(self, index: int) -> None:
+		"""
+		Helper method to cache the selected unit.
+		:param index: Index of the selected unit
+		:type index: int
+		:return: None
+		"""
+		self._unit_val = self.units[index]
+		return
+
 	@Slot()
 	def _get_save_path(self) -> None:
 		"""
@@ -128,7 +170,7 @@ class FsvNormalWidget(QWidget):
 			QMessageBox.warning(self, "Warning", "Please select a directory")
 			return
 
-	@Slot(dict)
+	@Slot(object)
 	def get_update(self, parameters: Dict[tuple, Any]) -> None:
 		"""
 		Gets updated parameters from the controller and shows them in the UI.
@@ -154,22 +196,21 @@ class FsvNormalWidget(QWidget):
 				if key[1] == "sweep_type":
 					# Map and set sweep type index
 					idx = self._map_sweep_type(parameter)
-					self.sweep_type.setCurrentIndex(idx)
+					set_index_if_changed(self.sweep_type, idx)
 				elif key[1] == "meas_type":
 					# Map and set measurement type index
 					idx = self._map_meas_type(parameter)
-					self.meas_type.setCurrentIndex(idx)
+					set_index_if_changed(self.meas_type, idx)
 				elif key[1] == "unit":
 					# Map and set unit index
 					idx = self._map_unit(parameter)
-					self.unit.setCurrentIndex(idx)
+					set_index_if_changed(self.unit, idx)
 				else:
 					# Update text fields for other parameters
 					widget = getattr(self, supported_params[key[1]])
-					# Clear and set new value
-					widget.clear()
-					widget.setText(parameter)
-			return
+					# Only set the new value if it changed
+					set_text_if_changed(widget, str(parameter))
+		return
 
 	@staticmethod
 	def _map_sweep_type(value: str) -> int:
@@ -6,10 +6,10 @@ Module for creating and operating the PySide6 LuxX+ expert mode widgets.
 @note:
 """
 from PySide6.QtCore import Signal, Slot
-from PySide6.QtGui import QDoubleValidator
 from PySide6.QtWidgets import QWidget, QGridLayout, QCheckBox, QPushButton, QSpacerItem, QLabel, QMessageBox
 
-from src.frontend.widgets.utilities import create_input_field, create_combo_box
+from src.frontend.widgets.utilities import (create_input_field, create_combo_box, get_double_validator,
+										   set_text_if_changed, set_index_if_changed, to_float)
 from typing import Dict, Any
 
 class LaserWidgetExpert(QWidget):
@@ -20,20 +20,26 @@ class LaserWidgetExpert(QWidget):
 	sendRequest = Signal(object)
 
 	# Available modulation and control modes
-	modulation_types = ["Standby", "CW", "Digital", "Analog"]
-	control_modes = ["ACC", "APC"]
+	modulation_types = ("Standby", "CW", "Digital", "Analog")
+	control_modes = ("ACC", "APC")
 
 	def __init__(self, device_id: str, laser_index: int, max_power: float=1.0) -> None:
 		"""Constructor method
 		"""
 		super().__init__()
+		# disable updates while the widgets are created to avoid repeated layout passes
+		self.setUpdatesEnabled(False)
 		# store device and laser information
 		self.device_id = device_id
 		self.laser_index = laser_index
 		self.max_power = max_power
+		# precompute the conversion factors between percent and absolute power
+		self._max_power_frac = max_power / 100.0
+		self._max_power_inv = 100.0 / max_power if max_power else 0.0
 
 		# creating layout
 		layout = QGridLayout()
+		layout.setEnabled(False)
 		layout.setVerticalSpacing(10)
 
 		# creating and adding widgets to layout
@@ -42,10 +48,10 @@ class LaserWidgetExpert(QWidget):
 
 		self.laser_power_percent = create_input_field(layout, "Setpoint λ-" + str(self.laser_index),
 													  "0.0", "%", 1, 0)
-		self.laser_power_percent.setValidator(QDoubleValidator())
+		self.laser_power_percent.setValidator(get_double_validator())
 		self.laser_power_absolute = create_input_field(layout, "Setpoint λ-" + str(self.laser_index),
 													   "0.0", "mW", 3, 0)
-		self.laser_power_absolute.setValidator(QDoubleValidator())
+		self.laser_power_absolute.setValidator(get_double_validator())
 
 
 		self.modulation_mode = create_combo_box(layout, self.modulation_types,
@@ -59,14 +65,21 @@ class LaserWidgetExpert(QWidget):
 		layout.addWidget(self.if_active, 10, 0)
 		layout.addWidget(apply_button, 11, 0)
 		self.setLayout(layout)
+		# re-enable layout and updates once all widgets are added
+		layout.setEnabled(True)
+		self.setUpdatesEnabled(True)
 
 		apply_button.clicked.connect(self._apply)
-		self.laser_power_percent.returnPressed.connect(
-			lambda: self._calc_power(True)
-		)
-		self.laser_power_absolute.returnPressed.connect(
-			lambda: self._calc_power(False)
-		)
+		self.laser_power_percent.returnPressed.connect(self._calc_from_percent)
+		self.laser_power_absolute.returnPressed.connect(self._calc_from_absolute)
+
+		# Supported update parameters and their handlers
+		# The emission status checkbox is not updated, this has to be done manually
+		self._update_handlers = {
+			"temp_power": self._apply_temp_power,
+			"operating_mode": self._apply_operating_mode,
+			"emission_status": lambda value: None
+		}
 		return
 
 	@Slot()
@@ -76,7 +89,7 @@ class LaserWidgetExpert(QWidget):
 		:return: None
 		"""
 		# Retrieve parameters from the UI
-		temp_power = float(self.laser_power_percent.text().replace(",", "."))
+		temp_power = to_float(self.laser_power_percent.text())
 		modulation = self.modulation_mode.currentIndex()
 		modulation = self.modulation_types[modulation]
 		control_mode = self.control_mode.currentIndex()
@@ -116,6 +129,23 @@ class LaserWidgetExpert(QWidget):
 			return 2
 
 	@Slot()
+	def _calc_from_percent(self) -> None:
+		"""
+		Calculates the absolute laser power from the percent input field.
+		:return: None
+		"""
+		self._calc_power(True)
+		return
+
+	@Slot()
+	def _calc_from_absolute(self) -> None:
+		"""
+		Calculates the percent laser power from the absolute input field.
+		:return: None
+		"""
+		self._calc_power(False)
+		return
+
 	def _calc_power(self, called_from_percent: bool) -> None:
 		"""
 		Calculates the laser power for either input fields.
@@ -124,15 +154,17 @@ class LaserWidgetExpert(QWidget):
 		:return: None
 		"""
 		if called_from_percent:
-			self.laser_power_absolute.clear()
-			power = float(self.laser_power_percent.text().replace(",", "."))
-			power = power * self.max_power / 100
-			self.laser_power_absolute.setText(str(power))
+			source, target, factor = self.laser_power_percent, self.laser_power_absolute, self._max_power_frac
 		else:
-			self.laser_power_percent.clear()
-			power = float(self.laser_power_absolute.text().replace(",", "."))
-			power = power / self.max_power * 100
-			self.laser_power_percent.setText(str(power))
+			source, target, factor = self.laser_power_absolute, self.laser_power_percent, self._max_power_inv
+		power = str(to_float(source.text()) * factor)
+
+		# Only update the other field if the value changed
+		# Signals are blocked to avoid triggering the connected slots again
+		if target.text() != power:
+			target.blockSignals(True)
+			target.setText(power)
+			target.blockSignals(False)
 		return
 
 	@Slot(object)
@@ -143,14 +175,9 @@ class LaserWidgetExpert(QWidget):
 		:type parameters: Dict[str, Any]
 		:return: None
 		"""
-		# Define supported parameters and their corresponding UI widgets
-		supported_parameters = {
-			"temp_power": "laser_power_percent",
-			"operating_mode": None,
-			"emission_status": "if_active"
-		}
 		for key, parameter in parameters.items():
-			if key[1] not in supported_parameters:
+			handler = self._update_handlers.get(key[1])
+			if handler is None:
 				# Show warning if unsupported parameter is encountered
 				QMessageBox.warning(
 					self,
@@ -158,20 +185,29 @@ class LaserWidgetExpert(QWidget):
 					f"something went wrong:\n{parameter} not supported."
 				)
 				return
-			if key[1] == "operating_mode":
-				# Map operating mode to modulation and control modes
-				modulation, control = self._map_ui_modes(parameter)
-				self.modulation_mode.setCurrentIndex(modulation)
-				self.control_mode.setCurrentIndex(control)
-			elif key[1] == "emission_status":
-				# Don't update checkbox state, this has to be done manually
-				continue
-			else:
-				# Update the corresponding UI widget with the new parameter value
-				widget = getattr(self, supported_parameters[key[1]])
-				# Clear and set new value
-				widget.clear()
-				widget.setText(str(parameter))
+			handler(parameter)
+		return
+
+	def _apply_temp_power(self, temp_power: float) -> None:
+		"""
+		Shows the updated laser power in the percent input field.
+		:param temp_power: Laser power in percent
+		:type temp_power: float
+		:return: None
+		"""
+		set_text_if_changed(self.laser_power_percent, str(temp_power))
+		return
+
+	def _apply_operating_mode(self, operating_mode: int) -> None:
+		"""
+		Maps the operating mode to the modulation and control modes and shows them in the UI.
+		:param operating_mode: Numeric operating mode from the device
+		:type operating_mode: int
+		:return: None
+		"""
+		modulation, control = self._map_ui_modes(operating_mode)
+		set_index_if_changed(self.modulation_mode, modulation)
+		set_index_if_changed(self.control_mode, control)
 		return
 
 	@staticmethod
@@ -6,36 +6,87 @@ Module for creating and operating the PySide6 Laser normal mode widgets.
 @note:
 """
 from PySide6.QtCore import Signal, Slot
-from PySide6.QtGui import QDoubleValidator, Qt
+from PySide6.QtGui import Qt
 from PySide6.QtWidgets import (QWidget, QGridLayout,
 							   QCheckBox, QPushButton, QSpacerItem,
 							   QLabel, QSpinBox)
 
-from src.frontend.widgets.utilities import create_input_field, create_combo_box
+from src.frontend.widgets.utilities import create_input_field, create_combo_box, get_double_validator, to_float
+
+# Lookup of (modulation mode, control mode) to the single digit ROM operating mode
+_OPERATING_MODES = {
+	("Standby", "ACC"): 0,
+	("Standby", "APC"): 0,
+	("CW", "ACC"): 1,
+	("CW", "APC"): 2,
+	("Digital", "ACC"): 3,
+	("Digital", "APC"): 3,
+	("Analog", "ACC"): 4,
+	("Analog", "APC"): 4,
+}
+# Lookup of modulation mode to frequency generator waveform, defaults to "sine"
+_WAVEFORMS = {
+	"Digital": "square",
+}
+
+def _map_operating_mode(modulation: str, control: str) -> int:
+	"""
+	Maps the desired modulation and control mode to the single digit ROM operating mode.
+	:param modulation: Selected modulation mode
+	:type modulation: str
+	:param control: Selected control mode
+	:type control: str
+	:return: The corresponding operating mode in ROM
+	:rtype: int
+	"""
+	return _OPERATING_MODES.get((modulation, control), 2)
 
+def _map_waveforms(modulation_mode) -> str:
+	"""
+	Maps the frequency generator waveform to the desired modulation mode.
+	:param modulation_mode: Selected modulation mode.
+	:type modulation_mode: str
+	:return: The corresponding waveform
+	:rtype: str
+	"""
+	return _WAVEFORMS.get(modulation_mode, "sine")
 
 class LaserWidgetNormal(QWidget):
 	"""
 	Create Normal mode widgets and functionality.
 	"""
 	# Request signal to send device parameters to device handler
+	# This carries a tuple with one parameter dictionary per channel
 	sendRequest = Signal(object)
 	# Update signal to update device parameters in device handler
 	sendUpdate = Signal(object, str)
 
 	# Available options of device parameters for combo boxes
-	modulation_modes = ["Standby", "CW", "Digital", "Analog"]
-	control_modes = ["ACC", "APC"]
-	lock_modes = ["indep", "master", "slave", "off"]
-	freq_gen_channels = ["1", "2", "3", "4"]
+	modulation_modes = ("Standby", "CW", "Digital", "Analog")
+	control_modes = ("ACC", "APC")
+	lock_modes = ("indep", "master", "slave", "off")
+	freq_gen_channels = ("1", "2", "3", "4")
+
+	# Parameter keys of the device requests
+	_K_WAVE = ("TGA1244", "waveform")
+	_K_FREQ = ("TGA1244", "frequency")
+	_K_LOCK = ("TGA1244", "lockmode")
+	_K_OUTPUT = ("TGA1244", "output")
+	_K_LASER1_OP = ("Laser1", "operating_mode")
+	_K_LASER1_POWER = ("Laser1", "temp_power")
+	_K_LASER2_OP = ("Laser2", "operating_mode")
+	_K_LASER2_POWER = ("Laser2", "temp_power")
 
 	def __init__(self) -> None:
 		"""Constructor method
 		"""
 		super().__init__()
+		# disable updates while the widgets are created to avoid repeated layout passes
+		self.setUpdatesEnabled(False)
 
 		# creating layout
 		layout = QGridLayout()
+		layout.setEnabled(False)
 		layout.setVerticalSpacing(10)
 
 		# creating and adding widgets to layout
@@ -58,9 +109,9 @@ class LaserWidgetNormal(QWidget):
 		self.spinbox2.setAlignment(Qt.AlignRight)
 
 		self.frequency1 = create_input_field(layout, "Modulation frequency", "0.0", "Hz", 7, 0)
-		self.frequency1.setValidator(QDoubleValidator())
+		self.frequency1.setValidator(get_double_validator())
 		self.frequency2 = create_input_field(layout, "Modulation frequency", "0,0", "Hz", 7, 2)
-		self.frequency2.setValidator(QDoubleValidator())
+		self.frequency2.setValidator(get_double_validator())
 
 		self.lockmode1 = create_combo_box(layout, self.lock_modes, "Lockmode", 9, 0)
 		self.lockmode2 = create_combo_box(layout, self.lock_modes, "Lockmode", 9, 2)
@@ -87,6 +138,9 @@ class LaserWidgetNormal(QWidget):
 		layout.addWidget(self.output2, 14, 2)
 		layout.addWidget(apply_button, 15, 1)
 		self.setLayout(layout)
+		# re-enable layout and updates once all widgets are added
+		layout.setEnabled(True)
+		self.setUpdatesEnabled(True)
 
 		apply_button.clicked.connect(self._apply)
 		return
@@ -97,32 +151,33 @@ class LaserWidgetNormal(QWidget):
 		Sends all device parameters as a Device request.
 		:return: None
 		"""
+		# Retrieving selected modulation and control modes once
+		modulation_1 = self.modulation_modes[self.modulation1.currentIndex()]
+		modulation_2 = self.modulation_modes[self.modulation2.currentIndex()]
+		control_1 = self.control_modes[self.control_mode1.currentIndex()]
+		control_2 = self.control_modes[self.control_mode2.currentIndex()]
+
 		# Mapping modulation and control modes to operating modes for both lasers
-		op_mode_1 = self._map_operating_mode(
-			self.modulation_modes[self.modulation1.currentIndex()],
-			self.control_modes[self.control_mode1.currentIndex()]
-		)
-		op_mode_2 = self._map_operating_mode(
-			self.modulation_modes[self.modulation2.currentIndex()],
-			self.control_modes[self.control_mode2.currentIndex()]
-		)
+		op_mode_1 = _map_operating_mode(modulation_1, control_1)
+		op_mode_2 = _map_operating_mode(modulation_2, control_2)
 		# mapping modulation modes to frequency generator waveforms for both lasers
-		wave_1 = self._map_waveforms(
-			self.modulation_modes[self.modulation1.currentIndex()]
-		)
-		wave_2 = self._map_waveforms(
-			self.modulation_modes[self.modulation2.currentIndex()]
-		)
+		wave_1 = _map_waveforms(modulation_1)
+		wave_2 = _map_waveforms(modulation_2)
 
 		# Ensuring power values are multiples of 5
 		# and updating spinboxes accordingly
-		power_1 = (self.spinbox1.value() // 5) * 5
-		self.spinbox1.setValue(power_1)
-		power_2 = (self.spinbox2.value() // 5) * 5
-		self.spinbox2.setValue(power_2)
+		# The spinboxes are only updated if the value had to be rounded
+		spin_1 = self.spinbox1.value()
+		spin_2 = self.spinbox2.value()
+		power_1 = (spin_1 // 5) * 5
+		power_2 = (spin_2 // 5) * 5
+		if power_1 != spin_1:
+			self.spinbox1.setValue(power_1)
+		if power_2 != spin_2:
+			self.spinbox2.setValue(power_2)
 		# Retrieving frequency values and converting to float
-		frequency_1 = float(self.frequency1.text().replace(',', '.'))
-		frequency_2 = float(self.frequency2.text().replace(',', '.'))
+		frequency_1 = to_float(self.frequency1.text())
+		frequency_2 = to_float(self.frequency2.text())
 
 		# Retrieving selected frequency generator channels
 		channel_1 = int(self.freq_gen_channels[self.channel1.currentIndex()])
@@ -137,62 +192,25 @@ class LaserWidgetNormal(QWidget):
 
 		# Creating parameter dictionaries for both channels and emitting signals
 		ch1_parameters = {
-			("TGA1244","waveform"): (wave_1, channel_1),
-			("TGA1244","frequency"): (frequency_1, channel_1),
-			("TGA1244","lockmode"): (lockmode_1, channel_1),
-			("TGA1244","output"): (output_1, channel_1),
-			("Laser1","operating_mode"): op_mode_1,
-			("Laser1","temp_power"): float(power_1),
+			self._K_WAVE: (wave_1, channel_1),
+			self._K_FREQ: (frequency_1, channel_1),
+			self._K_LOCK: (lockmode_1, channel_1),
+			self._K_OUTPUT: (output_1, channel_1),
+			self._K_LASER1_OP: op_mode_1,
+			self._K_LASER1_POWER: float(power_1),
 		}
-		# Emitting signals for channel 1
-		self.sendRequest.emit(ch1_parameters)
-		self.sendUpdate.emit(ch1_parameters, "laser")
 		# Creating parameter dictionary for channel 2
 		ch2_parameters = {
-			("TGA1244","waveform"): (wave_2, channel_2),
-			("TGA1244","frequency"): (frequency_2, channel_2),
-			("TGA1244","lockmode"): (lockmode_2, channel_2),
-			("TGA1244","output"): (output_2, channel_2),
-			("Laser2","operating_mode"): op_mode_2,
-			("Laser2","temp_power"): float(power_2),
+			self._K_WAVE: (wave_2, channel_2),
+			self._K_FREQ: (frequency_2, channel_2),
+			self._K_LOCK: (lockmode_2, channel_2),
+			self._K_OUTPUT: (output_2, channel_2),
+			self._K_LASER2_OP: op_mode_2,
+			self._K_LASER2_POWER: float(power_2),
 		}
-		# Emitting signals for channel 2
-		self.sendRequest.emit(ch2_parameters)
-		self.sendUpdate.emit(ch2_parameters, "laser")
+		# Emitting both channels at once
+		# The frequency generator keys are the same for both channels, so the dictionaries are not merged
+		parameters = (ch1_parameters, ch2_parameters)
+		self.sendRequest.emit(parameters)
+		self.sendUpdate.emit(parameters, "laser")
 		return
-
-	@staticmethod
-	def _map_operating_mode(modulation: str, control: str) -> int:
-		"""
-		Maps the desired modulation and control mode to the single digit ROM operating mode.
-		:param modulation: Selected modulation mode
-		:type modulation: str
-		:param control: Selected control mode
-		:type control: str
-		:return: The corresponding operating mode in ROM
-		:rtype: int
-		"""
-		if modulation == "Standby":
-			return 0
-		elif modulation == "Digital":
-			return 3
-		elif modulation == "Analog":
-			return 4
-		elif modulation == "CW" and control == "ACC":
-			return 1
-		else:
-			return 2
-
-	@staticmethod
-	def _map_waveforms(modulation_mode) -> str:
-		"""
-		Maps the frequency generator waveform to the desired modulation mode.
-		:param modulation_mode: Selected modulation mode.
-		:type modulation_mode: str
-		:return: The corresponding waveform
-		:rtype: str
-		"""
-		if modulation_mode == "Digital":
-			return "square"
-		else:
-			return "sine"
\ No newline at end of file
@@ -6,12 +6,37 @@ Module for creating and operating the PySide6 TGA1244 expert mode widgets.
 @note:
 """
 from PySide6.QtCore import Signal, Slot
-from PySide6.QtGui import QDoubleValidator
 from PySide6.QtWidgets import QWidget, QGridLayout, QPushButton, QCheckBox, QLabel, QMessageBox
 
-from src.frontend.widgets.utilities import create_input_field, create_combo_box
+from src.frontend.widgets.utilities import (create_input_field, create_combo_box, to_float,
+										   set_text_if_changed, set_index_if_changed, get_double_validator)
 from typing import Dict, Any
 
+# Lookup of waveform to the index in the UI, defaults to 3 ("dc")
+_WAVE_INDICES = {"sine": 0, "square": 1, "triang": 2, "dc": 3}
+# Lookup of lockmode to the index in the UI, defaults to 3 ("off")
+_LOCK_INDICES = {"indep": 0, "master": 1, "slave": 2, "off": 3}
+
+def _map_wave(waveform) -> int:
+	"""
+	Maps the waveform to the corresponding index in the UI.
+	:param waveform: Waveform
+	:type waveform: str
+	:return: Index of the waveform in the UI
+	:rtype: int
+	"""
+	return _WAVE_INDICES.get(waveform, 3)
+
+def _map_lock(lockmode) -> int:
+	"""
+	Maps the lockmode to the corresponding index in the UI
+	:param lockmode: Lockmode
+	:type lockmode: str
+	:return: Index of the lockmode in the UI
+	:rtype: int
+	"""
+	return _LOCK_INDICES.get(lockmode, 3)
+
 class FrequencyGeneratorWidget(QWidget):
 	"""
 	Create TGA1244 expert mode widgets and functionality.
@@ -20,40 +45,43 @@ class FrequencyGeneratorWidget(QWidget):
 	sendRequest = Signal(object)
 
 	# Possible options for the frequency generator
-	wave_forms = ["sine", "square", "triang", "dc"]
-	input_modes = ["Amp+Offset", "Low+High"]
-	lock_modes = ["indep", "master", "slave", "off"]
+	wave_forms = ("sine", "square", "triang", "dc")
+	input_modes = ("Amp+Offset", "Low+High")
+	_low_high_index = input_modes.index("Low+High")
+	lock_modes = ("indep", "master", "slave", "off")
+	# Supported update parameters, these are also the names of the corresponding UI widgets
+	_supported_parameters = frozenset({"waveform", "lockmode", "frequency", "amplitude",
+									   "offset", "phase", "output"})
 
 	def __init__(self, device_id: str, channel_index = int) -> None:
 		"""Constructor Method
 		"""
 		super().__init__()
+		# disable updates while the widgets are created to avoid repeated layout passes
+		self.setUpdatesEnabled(False)
 		# storing device and channel index
 		self.device_id = device_id
 		self.channel_index = channel_index
 
-		# creating layout #
-		layout = QGridLayout()
-		layout.setVerticalSpacing(10)
-
 		# creating and adding widgets to layout #
 		apply_button = QPushButton("Apply")
 		self.output = QCheckBox("Set active")
 
 		# creating layout and adding widgets to layout #
 		layout = QGridLayout()
+		layout.setEnabled(False)
 		layout.setVerticalSpacing(15)
 
 		self.waveform = create_combo_box(layout, self.wave_forms, "Waveform", 1, 0)
 		self.input_mode = create_combo_box(layout, self.input_modes, "Inputmode", 3, 0)
 		self.amplitude = create_input_field(layout, "Amp/Low", "0.0", "V", 5, 0)
-		self.amplitude.setValidator(QDoubleValidator())
+		self.amplitude.setValidator(get_double_validator())
 		self.offset = create_input_field(layout, "Offset/High", "0.0", "V", 7, 0)
-		self.offset.setValidator(QDoubleValidator())
+		self.offset.setValidator(get_double_validator())
 		self.frequency = create_input_field(layout, "Frequency", "0.0", "Hz", 9, 0)
-		self.frequency.setValidator(QDoubleValidator())
+		self.frequency.setValidator(get_double_validator())
 		self.phase = create_input_field(layout, "Pahse", "0.0", "Deg", 11, 0)
-		self.phase.setValidator(QDoubleValidator())
+		self.phase.setValidator(get_double_validator())
 
 		self.lockmode = create_combo_box(layout, self.lock_modes, "Lockmode", 13, 0)
 
@@ -61,8 +89,19 @@ class FrequencyGeneratorWidget(QWidget):
 		layout.addWidget(self.output, 15, 0)
 		layout.addWidget(apply_button, 16, 0)
 		self.setLayout(layout)
+		# re-enable layout and updates once all widgets are added
+		layout.setEnabled(True)
+		self.setUpdatesEnabled(True)
 
 		apply_button.clicked.connect(self._apply)
+
+		# Update handlers for the parameters that are not shown as text
+		# The output checkbox is not updated, this has to be done manually
+		self._update_handlers = {
+			"waveform": self._apply_waveform,
+			"lockmode": self._apply_lockmode,
+			"output": lambda value: None
+		}
 		return
 
 	@Slot()
@@ -74,12 +113,12 @@ class FrequencyGeneratorWidget(QWidget):
 		try:
 			# retrieving values from the UI
 			wave_form = self.wave_forms[self.waveform.currentIndex()]
-			input_mode = self.input_modes[self.input_mode.currentIndex()]
+			input_mode = self.input_mode.currentIndex()
 			lock_mode = self.lock_modes[self.lockmode.currentIndex()]
-			amplitude = float(self.amplitude.text().replace(",", "."))
-			offset = float(self.offset.text().replace(",", "."))
-			phase = float(self.phase.text().replace(",", "."))
-			frequency = float(self.frequency.text().replace(",", "."))
+			amplitude = to_float(self.amplitude.text())
+			offset = to_float(self.offset.text())
+			phase = to_float(self.phase.text())
+			frequency = to_float(self.frequency.text())
 			output = self.output.isChecked()
 		except Exception as e:
 			QMessageBox.warning(
@@ -89,9 +128,11 @@ class FrequencyGeneratorWidget(QWidget):
 			)
 			return
 		# adjusting amplitude and offset based on input mode
-		if input_mode == "Low+High":
-			amplitude = offset - amplitude
-			offset = (offset + amplitude) / 2
+		# For "Low+High" the amplitude field holds the low and the offset field the high value
+		if input_mode == self._low_high_index:
+			low, high = amplitude, offset
+			amplitude = high - low
+			offset = (high + low) / 2
 
 		# creating parameter dictionary
 		parameters = {
@@ -107,7 +148,7 @@ class FrequencyGeneratorWidget(QWidget):
 		self.sendRequest.emit(parameters)
 		return
 
-	@Slot(dict)
+	@Slot(object)
 	def get_update(self, parameters: Dict[tuple, Any]) -> None:
 		"""
 		Gets updated parameters from the controller and shows them in the UI.
@@ -115,22 +156,12 @@ class FrequencyGeneratorWidget(QWidget):
 		:type parameters: Dict[str, Any]
 		:return: None
 		"""
-		# Defining supported parameters of the frequency generator
-		supported_parameters = {
-			"waveform": "waveform",
-			"lockmode": "lockmode",
-			"frequency": "frequency",
-			"amplitude": "amplitude",
-			"offset": "offset",
-			"phase": "phase",
-			"output": "output",
-		}
 		for key, parameter in parameters.items():
 			# extracting actual value and channel index
 			# TODO: This should probably be switched to use device_id instead of channel_index
 			channel_index = parameter[1]
 			actual_value = parameter[0]
-			if key[1] not in supported_parameters:
+			if key[1] not in self._supported_parameters:
 				QMessageBox.warning(
 					self,
 					"UI Error",
@@ -145,57 +176,30 @@ class FrequencyGeneratorWidget(QWidget):
 					"The request and device index does not match"
 				)
 				return
-			if key[1] == "waveform":
-				# mapping waveform to index
-				idx = self._map_wave(actual_value)
-				self.waveform.setCurrentIndex(idx)
-			elif key[1] == "lockmode":
-				# mapping lockmode to index
-				idx = self._map_lock(actual_value)
-				self.lockmode.setCurrentIndex(idx)
-			elif key[1] == "output":
-				# setting output checkbox
-				continue
+			handler = self._update_handlers.get(key[1])
+			if handler is not None:
+				handler(actual_value)
 			else:
-				# setting value in the corresponding widget
-				widget = getattr(self, supported_parameters[key[1]])
-				# updating the value in the widget
-				widget.clear()
-				widget.insert(str(actual_value))
+				# setting value in the corresponding widget if it changed
+				set_text_if_changed(getattr(self, key[1]), str(actual_value))
 		return
 
-	@staticmethod
-	def _map_wave(waveform) -> int:
+	def _apply_waveform(self, waveform: str) -> None:
 		"""
-		Maps the waveform to the corresponding index in the UI.
+		Shows the updated waveform in the UI.
 		:param waveform: Waveform
 		:type waveform: str
-		:return: Index of the waveform in the UI
-		:rtype: int
+		:return: None
 		"""
-		if waveform == "sine":
-			return 0
-		elif waveform == "square":
-			return 1
-		elif waveform == "triang":
-			return 2
-		else:
-			return 3
-
-	@staticmethod
-	def _map_lock(lockmode) -> int:
+		set_index_if_changed(self.waveform, _map_wave(waveform))
+		return
+
+	def _apply_lockmode(self, lockmode: str) -> None:
 		"""
-		Maps the lockmode to the corresponding index in the UI
+		Shows the updated lockmode in the UI.
 		:param lockmode: Lockmode
 		:type lockmode: str
-		:return: Index of the lockmode in the UI
-		:rtype: int
+		:return: None
 		"""
-		if lockmode == "indep":
-			return 0
-		elif lockmode == "master":
-			return 1
-		elif lockmode == "slave":
-			return 2
-		else:
-			return 3
+		set_index_if_changed(self.lockmode, _map_lock(lockmode))
+		return
@@ -6,12 +6,11 @@ Module for creating and operating the PySide6 dialog window widgets.
 @note:
 """
 
-from PySide6.QtCore import Signal, Slot
+from PySide6.QtCore import Signal, Slot, QTimer
 from PySide6.QtGui import Qt
-from PySide6.QtWidgets import (QWidget, QLabel, QPushButton, QMessageBox,
-							   QSpacerItem, QGridLayout, QCheckBox, QDialog,
+from PySide6.QtWidgets import (QLabel, QPushButton, QMessageBox, QLineEdit,
+							   QFormLayout, QCheckBox, QDialog,
 							   QGroupBox, QVBoxLayout, QHBoxLayout)
-from src.frontend.widgets.utilities import create_input_field
 from typing import Dict, Any, Tuple, List, Literal
 import ipaddress
 
@@ -19,66 +18,47 @@ class LaserInfoDialog(QDialog):
 	"""
 	Dialog to show information about connected lasers.
 	"""
-	class SingleLaserWidget(QWidget):
+	# Offset of the laser labels in the flat label tuple
+	_laser_offsets = {"Laser1": 0, "Laser2": 6}
+	# Number of information labels per laser
+	_labels_per_laser = 6
+
+	class SingleLaserWidget(QGroupBox):
 		"""
-		Nested class to create the widget for a single laser.
+		Nested class to create the group box widget for a single laser.
 		Note that this is generally not a good practice, but it is done here to keep the code organized.
 		"""
+		# Initial texts of the information labels, in the order of the device information
+		initial_texts = (
+			"Model Code: Not connected",
+			"Device ID: Not connected",
+			"Firmware Version: Not connected",
+			"Operation Wavelength: Not connected",
+			"Maximum Power: Not connected",
+			"Device Stats: Not connected",
+		)
+		# Prefixes of the information labels when updated with device data
+		text_prefixes = ("Model Code: ", "Device ID: ", "", "", "", "")
+
 		def __init__(self, laser_name: str="Laser", parent=None) -> None:
 			"""Constructor method
 			"""
-			super().__init__(parent)
-
-			# make group box
-			self.group = QGroupBox(laser_name)
+			# the laser name is used as the group box title
+			super().__init__(laser_name, parent)
 
-			# create labels
+			# create labels, these are updated by the dialog
 			# The labels are initialized with "Not connected" text
-			self.model_code = QLabel("Model Code: Not connected")
-			self.device_id = QLabel("Device ID: Not connected")
-			self.firmware = QLabel("Firmware Version: Not connected")
-			self.wavelength = QLabel("Operation Wavelength: Not connected")
-			self.max_power = QLabel("Maximum Power: Not connected")
-			self.status = QLabel("Device Stats: Not connected")
+			self.labels = tuple(QLabel(text) for text in self.initial_texts)
+			(self.model_code, self.device_id, self.firmware,
+			 self.wavelength, self.max_power, self.status) = self.labels
 			# set layout
 			layout = QVBoxLayout()
 			# add widgets to layout
-			layout.addWidget(self.model_code)
-			layout.addWidget(self.device_id)
-			layout.addWidget(self.firmware)
-			layout.addWidget(self.wavelength)
-			layout.addWidget(self.max_power)
-			layout.addWidget(self.status)
+			for label in self.labels:
+				layout.addWidget(label)
 
 			# set layout to group box
-			self.group.setLayout(layout)
-
-			# set main layout
-			main_layout = QVBoxLayout()
-			main_layout.addWidget(self.group)
-			self.setLayout(main_layout)
-			return
-
-		def update_data(self, data: Dict[str, Any]) -> None:
-			"""
-			Update the laser information labels with new data.
-			:param data: New data dictionary
-			:type data: Dict[str, Any]
-			:return: None
-			"""
-			# Convert dict to a list
-			# This is done because the data will always be the same and the keys can be ignored
-			data_list = []
-			for key, data in data.items():
-				data_list.append(data)
-
-			# Update labels
-			self.model_code.setText("Model Code: " + str(data_list[0]))
-			self.device_id.setText("Device ID :" + str(data_list[1]))
-			self.firmware.setText(str(data_list[2]))
-			self.wavelength.setText(str(data_list[3]))
-			self.max_power.setText(str(data_list[4]))
-			self.status.setText(str(data_list[5]))
+			self.setLayout(layout)
 			return
 
 	def __init__(self, parent=None) -> None:
@@ -87,7 +67,8 @@ class LaserInfoDialog(QDialog):
 		super().__init__(parent)
 		# set window information
 		self.setWindowTitle("Laser Information")
-		self.setFixedSize(600, 400)
+		self.setMinimumSize(600, 400)
+		self.resize(600, 400)
 
 		# set layout
 		layout = QHBoxLayout()
@@ -99,6 +80,20 @@ class LaserInfoDialog(QDialog):
 		layout.addWidget(self.laser2_widget)
 
 		self.setLayout(layout)
+
+		# Flat labels and prefixes of both lasers, so updates run in a single loop
+		self._all_labels = self.laser1_widget.labels + self.laser2_widget.labels
+		self._prefixes = self.SingleLaserWidget.text_prefixes * 2
+		# Last texts set with device data
+		self._last_texts = [None] * len(self._all_labels)
+
+		# Pending laser data, only the latest data per laser is applied
+		self._pending = {}
+		# Timer to apply the pending data, rapid updates are collected into one
+		self._update_timer = QTimer(self)
+		self._update_timer.setSingleShot(True)
+		self._update_timer.setInterval(50)
+		self._update_timer.timeout.connect(self._apply_pending)
 		return
 
 	@Slot(object)
@@ -109,13 +104,37 @@ class LaserInfoDialog(QDialog):
 		:type data: Dict[str, dict]
 		:return: None
 		"""
-		# Update laser 1 data if available
-		if "Laser1" in data:
-			self.laser1_widget.update_data(data["Laser1"])
+		# Store the data and apply it once the timer runs out
+		self._pending.update(data)
+		if not self._update_timer.isActive():
+			self._update_timer.start()
+		return
 
-		# Update laser 2 data if available
-		if "Laser2" in data:
-			self.laser2_widget.update_data(data["Laser2"])
+	@Slot()
+	def _apply_pending(self) -> None:
+		"""
+		Apply the latest pending data to the laser information widgets.
+		:return: None
+		"""
+		pending = self._pending
+		self._pending = {}
+		labels = self._all_labels
+		prefixes = self._prefixes
+		last_texts = self._last_texts
+
+		# Update labels
+		for laser, data in pending.items():
+			offset = self._laser_offsets.get(laser)
+			if offset is None:
+				continue
+			# Only the values are used
+			# This is done because the data will always be the same and the keys can be ignored
+			for i, value in zip(range(offset, offset + self._labels_per_laser), data.values()):
+				text = f"{prefixes[i]}{value}"
+				# Only set the text if it changed since the last update
+				if last_texts[i] != text:
+					labels[i].setText(text)
+					last_texts[i] = text
 		return
 
 class PortSelectionDialog(QDialog):
@@ -131,48 +150,71 @@ class PortSelectionDialog(QDialog):
 		"""Constructor method
 		"""
 		super().__init__(parent)
+		# disable updates while the widgets are created to avoid repeated layout passes
+		self.setUpdatesEnabled(False)
 		# Set window information
 		self.setWindowTitle("Port Selection")
-		self.setFixedSize(400, 400)
+		self.setMinimumSize(400, 400)
+		self.resize(400, 400)
 
 		# set layout
-		layout = QGridLayout()
+		layout = QFormLayout()
+		layout.setEnabled(False)
 
 		# create input fields
-		self.stage_port = create_input_field(layout, "EcoVatio Port:", "", "", 0, 0)
-		self.stage_port.setAlignment(Qt.AlignLeft)
-		self.stage_baud = create_input_field(layout, "Baudrate:", "", "baud", 0, 1)
-
-		self.laser1_port = create_input_field(layout, "Laser 1 Port:", "", "", 2, 0)
-		self.laser1_port.setAlignment(Qt.AlignLeft)
-		self.laser1_baud = create_input_field(layout, "Baudrate:", "", "baud", 2, 1)
-
-		self.laser2_port = create_input_field(layout, "Laser 2 Port:", "", "", 4, 0)
-		self.laser2_port.setAlignment(Qt.AlignLeft)
-		self.laser2_baud = create_input_field(layout, "Baudrate:", "", "baud", 4, 1)
-
-		self.freq_gen_port = create_input_field(layout, "TGA 1244 Port:", "", "", 6, 0)
-		self.freq_gen_port.setAlignment(Qt.AlignLeft)
-		self.freq_gen_baud = create_input_field(layout, "Baudrate:", "", "baud", 6, 1)
-
-		self.fsv_port = create_input_field(layout, "FSV Port:", "", "", 8, 0)
-		self.fsv_port.setAlignment(Qt.AlignLeft)
-		self.fsv_baud = create_input_field(layout, "Baudrate:", "", "", 8, 1)
+		self.stage_port, self.stage_baud = self._add_port_row(layout, "EcoVatio Port:", "baud")
+		self.laser1_port, self.laser1_baud = self._add_port_row(layout, "Laser 1 Port:", "baud")
+		self.laser2_port, self.laser2_baud = self._add_port_row(layout, "Laser 2 Port:", "baud")
+		self.freq_gen_port, self.freq_gen_baud = self._add_port_row(layout, "TGA 1244 Port:", "baud")
+		self.fsv_port, self.fsv_baud = self._add_port_row(layout, "FSV Port:", "")
 
 		# create apply button
 		apply_button = QPushButton("Apply")
 		def_button = QPushButton("Set as default")
 
 		# set layout
-		layout.addItem(QSpacerItem(100, 10), 7, 0)
-		layout.addWidget(apply_button, 10, 0)
-		layout.addWidget(def_button, 10, 1)
+		button_row = QHBoxLayout()
+		button_row.addWidget(apply_button)
+		button_row.addWidget(def_button)
+		layout.addRow(button_row)
 
 		self.setLayout(layout)
+		# re-enable layout and updates once all widgets are added, then run a single layout pass
+		layout.setEnabled(True)
+		layout.activate()
+		self.setUpdatesEnabled(True)
 		apply_button.clicked.connect(self._apply_ports)
 		def_button.clicked.connect(self._set_default)
 		return
 
+	@staticmethod
+	def _add_port_row(layout: QFormLayout, name: str, unit: str) -> Tuple[QLineEdit, QLineEdit]:
+		"""
+		Add a row with port and baudrate input fields to the form layout.
+		:param layout: Form layout to add the row to
+		:type layout: QFormLayout
+		:param name: Name of the port
+		:type name: str
+		:param unit: Unit of the baudrate
+		:type unit: str
+		:return: The port and baudrate input fields
+		:rtype: Tuple[QLineEdit, QLineEdit]
+		"""
+		# create port and baudrate input fields
+		port = QLineEdit()
+		port.setAlignment(Qt.AlignLeft)
+		baud = QLineEdit()
+		baud.setAlignment(Qt.AlignRight)
+
+		# add fields and unit in one row
+		row = QHBoxLayout()
+		row.addWidget(port)
+		row.addWidget(QLabel("Baudrate:"))
+		row.addWidget(baud)
+		row.addWidget(QLabel(unit))
+		layout.addRow(name, row)
+		return port, baud
+
 	@staticmethod
 	def _normalize_port(port_str: str, baud_val: str) -> tuple:
 
@@ -222,17 +264,7 @@ class PortSelectionDialog(QDialog):
 		Get all ports and emit signal to save and close
 		:return: None
 		"""
-		try:
-			stage, laser1, laser2, freq_gen, fsv = self._get_dialog_data()
-
-		except TypeError as e:
-			QMessageBox.warning(
-				self.parent(),
-				"Error with port information",
-				f"One of the values entered is invalid:\n{e}"
-			)
-			return
-		self.applyPorts.emit(stage, laser1, laser2, freq_gen, fsv)
+		self._emit_ports(self.applyPorts)
 		return
 
 	@Slot()
@@ -241,6 +273,17 @@ class PortSelectionDialog(QDialog):
 		Get all ports and save to default file
 		:return: None
 		"""
+		self._emit_ports(self.defaultPorts)
+		return
+
+	def _emit_ports(self, signal) -> None:
+		"""
+		Get all ports from the dialog and emit them with the given signal.
+		Shows a warning if one of the values is invalid.
+		:param signal: Signal to emit the ports with
+		:type signal: Signal
+		:return: None
+		"""
 		try:
 			stage, laser1, laser2, freq_gen, fsv = self._get_dialog_data()
 
@@ -251,8 +294,7 @@ class PortSelectionDialog(QDialog):
 				f"One of the values entered is invalid:\n{e}"
 			)
 			return
-
-		self.defaultPorts.emit(stage, laser1, laser2, freq_gen, fsv)
+		signal.emit(stage, laser1, laser2, freq_gen, fsv)
 		return
 
 	@Slot(object)
@@ -293,27 +335,34 @@ class SettingsDialog(QDialog):
 		"""Constructor method
 		"""
 		super().__init__(parent)
+		# disable updates while the widgets are created to avoid repeated layout passes
+		self.setUpdatesEnabled(False)
 
 		# Set window information
 		self.setWindowTitle("Settings")
 		self.setMinimumSize(300, 150)
 
 		# set layout
-		layout = QGridLayout()
+		layout = QFormLayout()
+		layout.setEnabled(False)
 		layout.setVerticalSpacing(10)
 
 		# create input fields
-		self.username_input = create_input_field(layout, "Username:", "", "", 0, 0)
+		self.username_input = QLineEdit()
 		self.username_input.setAlignment(Qt.AlignLeft)
 		self.debug_mode_box = QCheckBox("Debug Mode")
 		self.debug_mode_box.setChecked(False)
 		self.apply_button = QPushButton("Apply")
 
-		layout.addItem(QSpacerItem(10, 100), 4, 0)
-		layout.addWidget(self.debug_mode_box, 5, 0)
-		layout.addWidget(self.apply_button, 6, 0)
+		layout.addRow("Username:", self.username_input)
+		layout.addRow(self.debug_mode_box)
+		layout.addRow(self.apply_button)
 
 		self.setLayout(layout)
+		# re-enable layout and updates once all widgets are added, then run a single layout pass
+		layout.setEnabled(True)
+		layout.activate()
+		self.setUpdatesEnabled(True)
 		self.apply_button.clicked.connect(self._apply)
 		return
 
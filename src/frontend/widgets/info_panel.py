@@ -6,12 +6,78 @@ Module for creating and operating the PySide6 info panel widgets.
 @note:
 """
 
-from PySide6.QtCore import Signal, Qt, Slot
-from PySide6.QtWidgets import QWidget, QGridLayout, QPushButton, QLabel, QFrame
+from dataclasses import dataclass
+from typing import Optional, Tuple
+from PySide6.QtCore import Signal, Qt, Slot, QSignalMapper, QTimer, QSize
+from PySide6.QtGui import QColor, QPixmap
+from PySide6.QtWidgets import QWidget, QGridLayout, QPushButton, QLabel
+
+# Info state texts, shared by all indicators
+_INFO_STATES = {
+	0: ("Moving", "Not Moving"),
+	1: ("Emission off", "Emission on"),
+	2: ("Closed", "Open", "Error")
+}
+# Fixed sizes of the indicators and the port buttons
+_INDICATOR_SIZE = QSize(14, 14)
+_BUTTON_SIZE = QSize(60, 30)
+# Indicator colors for the off/closed and on/open state
+_INDICATOR_COLORS = ("red", "green")
+# Indicator pixmaps for the off/closed and on/open state, created on first use
+_indicator_pixmaps = None
+# Status indicators: (name, label, info state index, row)
+_STATUS_SPECS = (
+	("EcoVarioStatus", "Stage :", 0, 0),
+	("Laser1Status", "Laser 1:", 1, 1),
+	("Laser2Status", "Laser 2:", 1, 2),
+)
+# Port indicators: (device ID, label, row)
+_PORT_SPECS = (
+	("EcoVario", "EcoVario port:", 4),
+	("TGA1244", "TGA 1244 port:", 6),
+	("Laser1", "Laser 1 port", 8),
+	("Laser2", "Laser 2 port:", 10),
+	("FSV3000", "FSV3000 Port:", 12),
+)
+
+def _get_indicator_pixmaps() -> Tuple[QPixmap, QPixmap]:
+	"""
+	Get the shared indicator pixmaps for the off/closed and on/open state.
+	They are created lazily, since a QApplication has to exist first.
+	:return: The off and on pixmaps
+	:rtype: Tuple[QPixmap, QPixmap]
+	"""
+	global _indicator_pixmaps
+	if _indicator_pixmaps is None:
+		pixmaps = []
+		for color in _INDICATOR_COLORS:
+			pixmap = QPixmap(_INDICATOR_SIZE)
+			pixmap.fill(QColor(color))
+			pixmaps.append(pixmap)
+		_indicator_pixmaps = tuple(pixmaps)
+	return _indicator_pixmaps
+
+@dataclass(slots=True)
+class _Indicator:
+	"""
+	Widgets and current state of a single indicator.
+	"""
+	# indicator label showing the state pixmap
+	frame: QLabel
+	# status text label
+	status: QLabel
+	# status texts (off_text, on_text)
+	text: tuple
+	# current state of the indicator
+	state: bool = False
+	# open and close buttons of port indicators
+	buttons: Optional[Tuple[QPushButton, QPushButton]] = None
 
 class InfoPanelWidget(QWidget):
 	"""
 	Class for creating the widgets and functionality of the info panel.
+	The laserInfoSig is emitted on every click of the laser info button,
+	the receiver should create the laser info dialog once and only show/raise it on later clicks.
 	"""
 	# update device port signal
 	updatePort = Signal(str, bool)
@@ -22,96 +88,134 @@ class InfoPanelWidget(QWidget):
 		"""Constructor method
 		"""
 		super().__init__()
-		# define info states
-		self.info_states = {
-			0: ["Moving", "Not Moving"],
-			1: ["Emission off", "Emission on"],
-			2: ["Closed", "Open", "Error"]
-		}
-		# dictionary for indicators
-		self.indicators = {}
+		# disable updates while the widgets are created to avoid repeated layout passes
+		self.setUpdatesEnabled(False)
+		# shared indicator pixmaps (off/closed, on/open)
+		self._pixmaps = _get_indicator_pixmaps()
+		# dictionary for indicators, pre-sized with all indicator names
+		self.indicators = dict.fromkeys(
+			[spec[0] for spec in _STATUS_SPECS] + [spec[0] for spec in _PORT_SPECS]
+		)
 
 		# create layout
 		self.layout = QGridLayout()
+		self.layout.setEnabled(False)
 		self.layout.setVerticalSpacing(5)
 
-		# create widgets
-		'''
-		I have to admit this is probably not the most elegant way to implement this.
-		However, given the limited number of indicators and the fixed layout, it works.
-		"Never change a running system" and all that.
-		'''
-		laser_button = QPushButton("Laser info")
-		laser_button.clicked.connect(self.laserInfoSig.emit)
-
-		self._create_status_indicator("EcoVarioStatus", "Stage :", self.info_states[0], 0, 0)
-		self._create_status_indicator("Laser1Status", "Laser 1:", self.info_states[1], 1, 0)
-		self._create_status_indicator("Laser2Status", "Laser 2:", self.info_states[1], 2, 0)
-		self.layout.addWidget(laser_button, 3, 0)
-
-		self._create_port_indicator("EcoVario", "EcoVario port:", self.info_states[2], 4, 0)
-		self._create_port_indicator("TGA1244", "TGA 1244 port:", self.info_states[2], 6, 0)
-		self._create_port_indicator("Laser1", "Laser 1 port", self.info_states[2], 8, 0)
-		self._create_port_indicator("Laser2", "Laser 2 port:", self.info_states[2], 10, 0)
-		self._create_port_indicator("FSV3000", "FSV3000 Port:", self.info_states[2], 12, 0)
-		self.setLayout(self.layout)
-
-		self.indicators["EcoVario"]["buttons"][0].clicked.connect(lambda: self._update_device_port_status("EcoVario", True))
-		self.indicators["EcoVario"]["buttons"][1].clicked.connect(lambda: self._update_device_port_status("EcoVario", False))
-
-		self.indicators["TGA1244"]["buttons"][0].clicked.connect(lambda: self._update_device_port_status("TGA1244", True))
-		self.indicators["TGA1244"]["buttons"][1].clicked.connect(lambda: self._update_device_port_status("TGA1244", False))
-
-		self.indicators["Laser1"]["buttons"][0].clicked.connect(lambda: self._update_device_port_status("Laser1", True))
-		self.indicators["Laser1"]["buttons"][1].clicked.connect(lambda: self._update_device_port_status("Laser1", False))
-		self.indicators["Laser2"]["buttons"][0].clicked.connect(lambda: self._update_device_port_status("Laser2", True))
-		self.indicators["Laser2"]["buttons"][1].clicked.connect(lambda: self._update_device_port_status("Laser2", False))
-
-		self.indicators["FSV3000"]["buttons"][0].clicked.connect(lambda: self._update_device_port_status("FSV3000", True))
-		self.indicators["FSV3000"]["buttons"][1].clicked.connect(lambda: self._update_device_port_status("FSV3000", False))
+		try:
+			# create widgets
+			laser_button = QPushButton("Laser info")
+			# connect the button signal directly to the laser info signal
+			laser_button.clicked.connect(self.laserInfoSig)
+
+			for name, label, state_index, row in _STATUS_SPECS:
+				self._build_indicator(name, label, _INFO_STATES[state_index], row, 0)
+			self.layout.addWidget(laser_button, 3, 0)
+
+			port_states = _INFO_STATES[2]
+			for name, label, row in _PORT_SPECS:
+				self._build_indicator(name, label, port_states, row, 0, with_buttons=True)
+			self.setLayout(self.layout)
+		finally:
+			# re-enable layout and updates once all widgets are added, then run a single layout pass
+			# This is also done if building the panel fails
+			self.layout.setEnabled(True)
+			self.layout.activate()
+			self.setUpdatesEnabled(True)
+
+		# connect open and close buttons of all port indicators
+		# The signal mappers forward the device ID of the clicked button
+		self._open_mapper = QSignalMapper(self)
+		self._close_mapper = QSignalMapper(self)
+		for name, _, _ in _PORT_SPECS:
+			open_button, close_button = self.indicators[name].buttons
+			self._open_mapper.setMapping(open_button, name)
+			open_button.clicked.connect(self._open_mapper.map)
+			self._close_mapper.setMapping(close_button, name)
+			close_button.clicked.connect(self._close_mapper.map)
+		self._open_mapper.mappedString.connect(self._open_port)
+		self._close_mapper.mappedString.connect(self._close_port)
+
+		# Pending indicator states, only the latest state per indicator is applied
+		self._pending = {}
+		# Timer to apply the pending states, rapid toggles are collected into one
+		self._update_timer = QTimer(self)
+		self._update_timer.setSingleShot(True)
+		self._update_timer.setInterval(50)
+		self._update_timer.timeout.connect(self._apply_pending)
 		return
 
-	def _create_status_indicator(self, name: str, label: str,
-								 status: list, row: int, column: int) -> None:
+	def _build_indicator(self, name: str, label: str, status: tuple,
+						 row: int, column: int, with_buttons: bool = False) -> None:
 		"""
-		Create status indicator with given name, label and status texts.
+		Create indicator with given name, label and status texts.
+		Port indicators additionally get open and close buttons in the row below.
 		:param name: Name of the indicator
 		:type name: str
 		:param label: Label of the indicator
 		:type label: str
-		:param status: status texts [off_text, on_text]
-		:type status: list
+		:param status: Status texts (off_text, on_text)
+		:type status: tuple
 		:param row: Row in the layout
 		:type row: int
 		:param column: Column in the layout
 		:type column: int
+		:param with_buttons: Create open and close buttons
+		:type with_buttons: bool
 		:return: None
 		"""
-		# create label, status label and indicator frame
+		# create label, status label and indicator
 		label = QLabel(label)
 		label.setAlignment(Qt.AlignRight)
 		status_label = QLabel(status[0])
-		indicator = QFrame()
-		indicator.setFixedSize(14, 14)
-		# set initial color to red (off)
-		indicator.setStyleSheet("background-color: red")
+		indicator = QLabel()
+		indicator.setFixedSize(_INDICATOR_SIZE)
+		# set initial pixmap to red (off/closed)
+		indicator.setPixmap(self._pixmaps[0])
 
 		# add to layout
 		self.layout.addWidget(label, row, column)
 		self.layout.addWidget(indicator, row, column + 1, alignment=Qt.AlignRight)
 		self.layout.addWidget(status_label, row, column + 2)
 
-		# store indicator data
-		indicator_data = {
-			"frame": indicator,
-			"status": status_label,
-			"text": status
-		}
+		buttons = None
+		if with_buttons:
+			# create open and close buttons
+			open_button = QPushButton("Open")
+			open_button.setFixedSize(_BUTTON_SIZE)
+			close_button = QPushButton("Close")
+			close_button.setFixedSize(_BUTTON_SIZE)
+			self.layout.addWidget(open_button, row + 1, column)
+			self.layout.addWidget(close_button, row + 1, column + 1)
+			buttons = (open_button, close_button)
 
-		# store in indicators dictionary
-		self.indicators[name] = indicator_data
+		# store indicator data in indicators dictionary
+		self.indicators[name] = _Indicator(indicator, status_label, status, buttons=buttons)
 		return None
 
+	@Slot(str)
+	def _open_port(self, device_id: str) -> None:
+		"""
+		Request to open the port of the given device.
+		:param device_id: ID of the device
+		:type device_id: str
+		:return: None
+		"""
+		self._update_device_port_status(device_id, True)
+		return
+
+	@Slot(str)
+	def _close_port(self, device_id: str) -> None:
+		"""
+		Request to close the port of the given device.
+		:param device_id: ID of the device
+		:type device_id: str
+		:return: None
+		"""
+		self._update_device_port_status(device_id, False)
+		return
+
+	@Slot(str, bool)
 	def _update_device_port_status(self, device_id: str, status: bool) -> None:
 		"""
 		Update device port status signal emitter.
@@ -124,59 +228,37 @@ class InfoPanelWidget(QWidget):
 		self.updatePort.emit(device_id, status)
 		return
 
-	def _create_port_indicator(self, name: str, label: str,
-							   status: list, row: int, column: int) -> None:
+	@Slot(str, bool)
+	def update_indicator(self, name: str, state: bool) -> None:
 		"""
-		Create port indicator with given name, label and status texts.
-		:param name: Name of the indicator
+		Update indicator state.
+		:param name: Name of the indicator to update
 		:type name: str
-		:param label: Label of the indicator
-		:type label: str
-		:param status: Status texts [closed_text, open_text]
-		:type status: list
-		:param row: Row in the layout
-		:type row: int
-		:param column: Column in the layout
-		:type column: int
+		:param state: State of the indicator (True = on/open, False = off/closed)
+		:type state: bool
 		:return: None
 		"""
-		# create label, status label, indicator frame and buttons
-		label = QLabel(label)
-		label.setAlignment(Qt.AlignRight)
-		status_label = QLabel(status[0])
-		indicator = QFrame()
-		indicator.setFixedSize(14, 14)
-		# set initial color to red (closed)
-		indicator.setStyleSheet("background-color: red")
-
-		# create open and close buttons
-		open_button = QPushButton("Open")
-		open_button.setFixedSize(60, 30)
-		close_button = QPushButton("Close")
-		close_button.setFixedSize(60, 30)
+		# Store the state and apply it once the timer runs out
+		self._pending[name] = state
+		if not self._update_timer.isActive():
+			self._update_timer.start()
+		return None
 
-		# add to layout
-		self.layout.addWidget(label, row, column)
-		self.layout.addWidget(indicator, row, column + 1, alignment=Qt.AlignRight)
-		self.layout.addWidget(status_label, row, column + 2)
-		self.layout.addWidget(open_button, row + 1, column)
-		self.layout.addWidget(close_button, row + 1, column + 1)
-
-		# store indicator data
-		indicator_data = {
-			"frame": indicator,
-			"status": status_label,
-			"text": status,
-			"buttons": [open_button, close_button]
-		}
-		# store in indicators dictionary
-		self.indicators[name] = indicator_data
+	@Slot()
+	def _apply_pending(self) -> None:
+		"""
+		Apply the latest pending states to the indicators.
+		:return: None
+		"""
+		pending = self._pending
+		self._pending = {}
+		for name, state in pending.items():
+			self._apply_indicator(name, state)
 		return None
 
-	@Slot(str, bool)
-	def update_indicator(self, name: str, state: bool) -> None:
+	def _apply_indicator(self, name: str, state: bool) -> None:
 		"""
-		Update indicator state.
+		Show the given state in the indicator.
 		:param name: Name of the indicator to update
 		:type name: str
 		:param state: State of the indicator (True = on/open, False = off/closed)
@@ -185,14 +267,13 @@ class InfoPanelWidget(QWidget):
 		"""
 		# get the current indicator
 		current_indicator = self.indicators[name]
-		if state:
-			# set to green (on/open)
-			current_indicator["frame"].setStyleSheet("background-color: green")
-			current_indicator["status"].setText(current_indicator["text"][1])
-			return None
-		else:
-			# set to red (off/closed)
-			current_indicator["frame"].setStyleSheet("background-color: red")
-			current_indicator["status"].setText(current_indicator["text"][0])
+		if current_indicator.state == state:
+			# nothing to do if the state did not change
 			return None
+		current_indicator.state = state
+		# set to green (on/open) or red (off/closed)
+		index = 1 if state else 0
+		current_indicator.frame.setPixmap(self._pixmaps[index])
+		current_indicator.status.setText(current_indicator.text[index])
+		return None
 
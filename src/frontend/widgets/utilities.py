@@ -8,7 +8,68 @@ for PySide6 applications
 """
 
 from PySide6.QtCore import Qt
-from PySide6.QtWidgets import QLabel, QComboBox, QLineEdit
+from PySide6.QtGui import QDoubleValidator
+from PySide6.QtWidgets import QApplication, QLabel, QComboBox, QLineEdit
+
+# Alignment of the value widgets
+_ALIGN_RIGHT = Qt.AlignRight
+# Style sheet of the output fields
+_OUTPUT_FIELD_STYLE = "QLabel{border:2px solid grey;}"
+
+# Shared validator for all numeric input fields, created on first use
+_double_validator = None
+
+def get_double_validator() -> QDoubleValidator:
+	"""
+	Get the shared double validator for numeric input fields.
+	Validators are stateless, so one instance can be used by all fields.
+	It is created lazily, since a QApplication has to exist first, and parented to the application.
+
+	:return: The shared double validator
+	:rtype: QDoubleValidator
+	"""
+	global _double_validator
+	if _double_validator is None:
+		_double_validator = QDoubleValidator(QApplication.instance())
+	return _double_validator
+
+def to_float(text: str) -> float:
+	"""
+	Convert the text of an input field to float. A decimal comma is accepted as well.
+	The comma is only replaced if the text contains one.
+
+	:param text: Text to convert
+	:type text: str
+	:return: The converted value
+	:rtype: float
+	"""
+	if "," in text:
+		text = text.replace(",", ".")
+	return float(text)
+
+def _add_labeled(layout, widget, name: str, unit: str | None, row: int, column: int) -> None:
+	"""
+	Add a widget with a name label above it and an optional unit label next to it.
+
+	:param layout: Layout to place the widgets in
+	:type layout: QGridLayout
+	:param widget: Value widget
+	:type widget: QWidget
+	:param name: Name of the value
+	:type name: str
+	:param unit: Unit of the value, no unit label is added if None
+	:type unit: str | None
+	:param row: Row in the layout
+	:type row: int
+	:param column: Column in the layout
+	:type column: int
+	:return: None
+	"""
+	layout.addWidget(QLabel(name), row, column)
+	layout.addWidget(widget, row + 1, column)
+	if unit is not None:
+		layout.addWidget(QLabel(unit), row + 1, column + 1)
+	return
 
 def create_output_field(
 		layout,
@@ -37,19 +98,12 @@ def create_output_field(
 	"""
 	# create and edit main label
 	main_label = QLabel(init_value)
-	main_label.setAlignment(Qt.AlignRight)
-	main_label.setStyleSheet("QLabel{border:2px solid grey;}")
+	main_label.setAlignment(_ALIGN_RIGHT)
+	main_label.setStyleSheet(_OUTPUT_FIELD_STYLE)
 	main_label.setFixedHeight(22)
 
-	# create unit and name
-	secondary_label = QLabel(unit)
-	name_label = QLabel(name)
-
-	# add to layout at fixed distances
-	layout.addWidget(name_label, row, column)
-	layout.addWidget(main_label, row + 1, column)
-	layout.addWidget(secondary_label, row + 1, column + 1)
-
+	# add with name and unit to layout at fixed distances
+	_add_labeled(layout, main_label, name, unit, row, column)
 	return main_label
 
 def create_input_field(
@@ -78,20 +132,14 @@ def create_input_field(
 	:rtype: QLineEdit
 	"""
 	main_line = QLineEdit(init_value)
-	main_line.setAlignment(Qt.AlignRight)
-
-	unit_label = QLabel(unit)
-	name_label = QLabel(name)
-
-	layout.addWidget(name_label, row, column)
-	layout.addWidget(main_line, row+1, column)
-	layout.addWidget(unit_label, row+1, column+1)
+	main_line.setAlignment(_ALIGN_RIGHT)
 
+	_add_labeled(layout, main_line, name, unit, row, column)
 	return main_line
 
 def create_combo_box(
 		layout,
-		items: list,
+		items: list | tuple,
 		name:str,
 		row: int,
 		column: int) -> QComboBox:
@@ -101,7 +149,7 @@ def create_combo_box(
 	:param layout: Layout to place the output field in
 	:type layout: QGridLayout
 	:param items: Items to add to the combo box.
-	:type items: list
+	:type items: list | tuple
 	:param name: Name of the combo box
 	:type name: str
 	:param row: Row in the layout
@@ -114,9 +162,34 @@ def create_combo_box(
 	combo_box = QComboBox()
 	combo_box.addItems(items)
 
-	name_label = QLabel(name)
+	_add_labeled(layout, combo_box, name, None, row, column)
+	return combo_box
 
-	layout.addWidget(name_label, row, column)
-	layout.addWidget(combo_box, row+1, column)
+def set_text_if_changed(widget, text: str) -> None:
+	"""
+	Set the text of a label or line edit only if it differs from the current text.
+	This avoids unnecessary repaints and textChanged signals for polled values.
+
+	:param widget: Widget to update
+	:type widget: QLabel | QLineEdit
+	:param text: New text of the widget
+	:type text: str
+	:return: None
+	"""
+	if widget.text() != text:
+		widget.setText(text)
+	return
 
-	return combo_box
\ No newline at end of file
+def set_index_if_changed(combo_box: QComboBox, index: int) -> None:
+	"""
+	Set the current index of a combo box only if it differs from the current index.
+
+	:param combo_box: Combo box to update
+	:type combo_box: QComboBox
+	:param index: New index of the combo box
+	:type index: int
+	:return: None
+	"""
+	if combo_box.currentIndex() != index:
+		combo_box.setCurrentIndex(index)
+	return